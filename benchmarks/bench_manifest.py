@@ -0,0 +1,77 @@
+"""Benchmark of the aggregation of raw site data into the manifest (build_manifest)
+against the linear scan it replaced, on synthetic raw site data.
+
+Run from the root of the repository:
+
+    $ python -m benchmarks.bench_manifest
+"""
+import logging
+import random
+import timeit
+
+import click
+
+from make_manifest import build_manifest
+
+
+def linear_scan_manifest(sites, minwidth):
+    # The aggregation build_manifest replaced, which looks up every icon in the list
+    # of the entries found so far.
+    results = []
+    for site in sites:
+        icon = site.get('best_icon_url')
+        icon_width = site.get('best_icon_width')
+        if (icon is None) or (icon_width < minwidth):
+            continue
+        existing = next((x for x in results if x.get('image_url') == icon), None)
+        if existing:
+            existing.get('domains').append(site.get('hostname'))
+        else:
+            results.append({
+                'image_url': icon,
+                'domains': [site.get('hostname')]
+            })
+    return sorted(results, key=lambda site: site['domains'][0])
+
+
+def synthetic_sites(count, seed=0):
+    # Like real crawls, most sites have an icon of their own while some share an icon
+    # with other sites (regional domains) and a few have no usable icon.
+    rng = random.Random(seed)
+    sites = []
+    for rank in range(1, count + 1):
+        if rng.random() < 0.2:
+            icon = f'https://cdn.example/shared-{rng.randrange(count // 20 + 1)}.png'
+        else:
+            icon = f'https://site{rank}.example/icon.png'
+        sites.append({
+            'hostname': f'site{rank}.example',
+            'url': f'https://site{rank}.example',
+            'rank': rank,
+            'best_icon_url': icon,
+            'best_icon_width': rng.choice([32, 96, 144, 192]),
+        })
+    return sites
+
+
+@click.command()
+@click.option('--sizes', default='1000,2000,5000,10000,20000,100000', help='Comma separated numbers of sites to aggregate.')
+@click.option('--max-linear', default=10000, help='Largest number of sites the linear scan is timed for.')
+@click.option('--repeat', default=3, help='Number of times each aggregation is timed, the best time is reported.')
+def main(sizes, max_linear, repeat):
+    logging.disable(logging.INFO)
+    click.echo(f'{"sites":>8} {"build_manifest":>16} {"linear scan":>16}')
+    for size in (int(x) for x in sizes.split(',')):
+        sites = synthetic_sites(size)
+        indexed = min(timeit.repeat(lambda: build_manifest(sites, 96), number=1, repeat=repeat))
+        if size <= max_linear:
+            assert build_manifest(sites, 96) == linear_scan_manifest(sites, 96)
+            linear = min(timeit.repeat(lambda: linear_scan_manifest(sites, 96), number=1, repeat=repeat))
+            linear = f'{linear * 1000:14.1f}ms'
+        else:
+            linear = f'{"-":>16}'
+        click.echo(f'{size:>8} {indexed * 1000:14.1f}ms {linear}')
+
+
+if __name__ == '__main__':
+    main()
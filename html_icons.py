@@ -0,0 +1,116 @@
+import codecs
+import hashlib
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+
+# Values of the rel attribute of the <link> tags that declare icons
+ICON_LINK_RELS = frozenset([
+    'apple-touch-icon',
+    'apple-touch-icon-precomposed',
+    'icon shortcut',
+    'shortcut icon',
+    'icon',
+    'SHORTCUT ICON',
+    'fluid-icon',
+])
+# Values of the name attribute of the <meta> tags that declare icons
+ICON_META_NAMES = frozenset(['apple-touch-icon'])
+# Attributes whose values are lists of whitespace separated tokens, which are parsed
+# into lists like BeautifulSoup does.
+LIST_ATTRIBUTES = {
+    'link': frozenset(['rel', 'rev', 'class', 'accesskey', 'dropzone']),
+    'meta': frozenset(['class', 'accesskey', 'dropzone']),
+}
+# The document is read in chunks of this size until the end of its head
+HEAD_CHUNK_SIZE = 16 * 1024
+# Number of bytes of a document after which parsing stops, even within its head
+HEAD_MAX_BYTES = 1024 * 1024
+
+CHARSET_PATTERN = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+class IconParser(HTMLParser):
+    """Collects the icons declared by the <link> and <meta> tags of the head of an
+    HTML document, as dicts of their attributes with the url of the icon under 'href'
+    made absolute using `base_url`. `done` is set once the head has been parsed.
+    """
+
+    def __init__(self, base_url):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.done = False
+        self.links = []
+        self.metas = []
+
+    @property
+    def icons(self):
+        return self.links + self.metas
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'body':
+            self.done = True
+        # The rest of the chunk the head ended in is still fed to the parser.
+        if self.done or tag not in LIST_ATTRIBUTES:
+            return
+        attributes = {}
+        for name, value in attrs:
+            value = value or ''
+            attributes[name] = value.split() if name in LIST_ATTRIBUTES[tag] else value
+        if tag == 'link':
+            self._add_link(attributes)
+        else:
+            self._add_meta(attributes)
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.done = True
+
+    def _resolve(self, icon_url):
+        if not icon_url.startswith('http') and not icon_url.startswith('//'):
+            return urljoin(self.base_url, icon_url)
+        return icon_url
+
+    def _add_link(self, icon):
+        if ' '.join(icon.get('rel', [])) not in ICON_LINK_RELS or 'href' not in icon:
+            return
+        if icon['href'].startswith('data:'):
+            return
+        icon['href'] = self._resolve(icon['href'])
+        self.links.append(icon)
+
+    def _add_meta(self, icon):
+        if icon.get('name') not in ICON_META_NAMES or 'content' not in icon:
+            return
+        if icon['content'].startswith('data:'):
+            return
+        icon['href'] = self._resolve(icon['content'])
+        self.metas.append(icon)
+
+
+def _decoder(response):
+    match = CHARSET_PATTERN.search(response.headers.get('Content-Type', ''))
+    try:
+        return codecs.getincrementaldecoder(match.group(1) if match else 'UTF-8')(errors='replace')
+    except LookupError:
+        return codecs.getincrementaldecoder('UTF-8')(errors='replace')
+
+
+def parse_head(response, parser, max_bytes=HEAD_MAX_BYTES):
+    """Feed the HTML document of the streamed `response` to `parser` (an IconParser)
+    until the end of its head or until `max_bytes` have been read, whichever comes
+    first, so that the body of the document is usually not downloaded at all.
+
+    Returns the SHA-256 hex digest of the part of the document that was read."""
+    decoder = _decoder(response)
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in response.iter_content(HEAD_CHUNK_SIZE):
+        size += len(chunk)
+        digest.update(chunk)
+        parser.feed(decoder.decode(chunk))
+        if parser.done or size >= max_bytes:
+            return digest.hexdigest()
+    parser.feed(decoder.decode(b'', final=True))
+    return digest.hexdigest()
@@ -0,0 +1,203 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+import zlib
+from datetime import timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from http_session import PooledAdapter, TRANSFER_HEADERS
+
+
+# Prefix of the User-Agent requests sends when the caller doesn't set one
+DEFAULT_USER_AGENT_PREFIX = 'python-requests/'
+
+
+class HTTPArchive:
+    """An archive of the responses to the HTTP requests of a crawl, stored at `path`, to
+    record a crawl (`record=True`) and replay it later without network.
+
+    The archive is a sequence of records, each a line of JSON followed, for bodies, by
+    the compressed body. A response record maps the key of a request (its method, url,
+    user agent and validators) to the status, headers and url of its response and to
+    the digest of its body, or to the error it failed with. A body shared by several
+    responses is only stored once, before the first response that has it. Records are
+    flushed as soon as they are added and the archive is indexed by reading it when it
+    is replayed, so that the requests recorded by an interrupted crawl can be replayed.
+
+    When replaying with `latency`, each response takes as long as it did when it was
+    recorded.
+    """
+
+    def __init__(self, path, record=False, latency=False):
+        self.path = path
+        self.record = record
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._file = open(path, 'wb' if record else 'rb')
+        # Keys of the responses and digests of the bodies in the archive, mapped to
+        # their entry and to the offset and size of their record when replaying.
+        self._index = {}
+        self._bodies = {}
+        if not record:
+            self._read_index()
+        self.misses = 0
+
+    @staticmethod
+    def key(request):
+        headers = request.headers
+        user_agent = headers.get('User-Agent')
+        # The default user agent changes with the version of requests, which doesn't
+        # change the responses.
+        if user_agent and user_agent.startswith(DEFAULT_USER_AGENT_PREFIX):
+            user_agent = None
+        fields = [request.method, request.url, user_agent,
+                  headers.get('If-None-Match'), headers.get('If-Modified-Since')]
+        return hashlib.sha256('\n'.join(field or '' for field in fields).encode('UTF-8')).hexdigest()
+
+    def _read_index(self):
+        # A record that was being written when the recording was interrupted ends the
+        # archive: it is skipped.
+        size = self._file.seek(0, 2)
+        self._file.seek(0)
+        while True:
+            line = self._file.readline()
+            if not line:
+                return
+            try:
+                if not line.endswith(b'\n'):
+                    raise ValueError('truncated record')
+                record = json.loads(line.decode('UTF-8'))
+                if 'key' in record:
+                    if record.get('body') is None or record['body'] in self._bodies:
+                        self._index[record.pop('key')] = record
+                else:
+                    offset = self._file.tell()
+                    if offset + record['size'] > size:
+                        raise ValueError('truncated body')
+                    self._bodies[record['body']] = (offset, record['size'])
+                    self._file.seek(record['size'], 1)
+            except (ValueError, KeyError, TypeError):
+                logging.info(f'Skipping incomplete record at the end of HTTP archive {self.path}')
+                return
+
+    def _write_record(self, record, data=b''):
+        self._file.write(json.dumps(record).encode('UTF-8') + b'\n' + data)
+        self._file.flush()
+
+    def adapter(self, **kwargs):
+        """Return the transport adapter that records to or replays from the archive."""
+        if self.record:
+            return RecordingAdapter(self, **kwargs)
+        return ReplayAdapter(self)
+
+    def add(self, request, response=None, body=None, error=None, elapsed=0):
+        """Add the `response` (with its decoded `body`) to `request`, or the `error` it
+        failed with. Only the first response to identical requests is kept."""
+        entry = {'key': self.key(request), 'url': request.url, 'elapsed': elapsed}
+        if error is not None:
+            entry.update(error=type(error).__name__, message=str(error))
+        else:
+            entry.update({
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': {name: value for name, value in response.headers.items()
+                            if name.lower() not in TRANSFER_HEADERS},
+                'body': hashlib.sha256(body).hexdigest(),
+            })
+        with self._lock:
+            if entry['key'] in self._index:
+                return
+            if error is None and entry['body'] not in self._bodies:
+                data = zlib.compress(body)
+                self._write_record({'body': entry['body'], 'size': len(data)}, data)
+                self._bodies[entry['body']] = None
+            self._write_record(entry)
+            self._index[entry['key']] = None
+
+    def lookup(self, request):
+        """Return the entry of `request` (with its body, if any, under 'content') or None."""
+        with self._lock:
+            entry = self._index.get(self.key(request))
+            if entry is None:
+                self.misses += 1
+                return None
+            entry = dict(entry)
+            if entry.get('body') is not None:
+                offset, size = self._bodies[entry['body']]
+                self._file.seek(offset)
+                entry['content'] = zlib.decompress(self._file.read(size))
+        return entry
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class RecordingAdapter(PooledAdapter):
+    """A PooledAdapter that adds every response it receives to an HTTPArchive. The body
+    of each response is read in full, even when the caller only streams part of it, so
+    that the archive can be replayed to callers that read more of it."""
+
+    def __init__(self, archive, *args, **kwargs):
+        self.archive = archive
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        start = time.monotonic()
+        try:
+            response = super().send(request, **kwargs)
+            body = response.content
+        except requests.RequestException as e:
+            self.archive.add(request, error=e, elapsed=time.monotonic() - start)
+            raise
+        self.archive.add(request, response, body, elapsed=time.monotonic() - start)
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """A transport adapter that answers requests with the responses recorded in an
+    HTTPArchive, and with a ConnectionError the requests that are not in it."""
+
+    def __init__(self, archive):
+        self.archive = archive
+        self._lock = threading.Lock()
+        self._requests = 0
+        super().__init__()
+
+    def connection_stats(self):
+        with self._lock:
+            return {'requests': self._requests, 'connections': 0, 'reused': 0}
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        with self._lock:
+            self._requests += 1
+        entry = self.archive.lookup(request)
+        if entry is None:
+            raise requests.ConnectionError(f'{request.method} {request.url} is not in the HTTP archive',
+                                           request=request)
+        if self.archive.latency:
+            time.sleep(entry['elapsed'])
+        if 'error' in entry:
+            error = getattr(requests.exceptions, entry['error'], None)
+            if not (isinstance(error, type) and issubclass(error, requests.RequestException)):
+                error = requests.ConnectionError
+            raise error(entry['message'], request=request)
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = entry['reason']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = entry['url']
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(seconds=entry['elapsed'])
+        response._content = entry['content']
+        response._content_consumed = True
+        return response
@@ -0,0 +1,262 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+# Number of hosts for which a pool of connections is kept around
+DEFAULT_POOL_CONNECTIONS = 100
+# Number of connections kept alive for each host
+DEFAULT_POOL_MAXSIZE = 10
+# Headers that describe how a body was transferred rather than the body itself
+TRANSFER_HEADERS = frozenset(['content-encoding', 'content-length', 'transfer-encoding', 'connection'])
+
+
+@contextmanager
+def atomic_open(path, mode='wb'):
+    """Open a temporary file next to `path` for writing, which replaces `path` once it
+    is closed, so that readers (and later runs if this one is interrupted) never see a
+    partially written file. The temporary file is removed if writing it fails."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary_path = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(fd, mode) as outfile:
+            yield outfile
+        os.replace(temporary_path, path)
+    except BaseException:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+        raise
+
+
+class PooledAdapter(HTTPAdapter):
+    """An HTTPAdapter that keeps count of the connections opened and the requests
+    sent by its connection pools, including pools that were already discarded."""
+
+    def __init__(self, *args, **kwargs):
+        self._lock = threading.Lock()
+        self._discarded_connections = 0
+        self._discarded_requests = 0
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pools.dispose_func = self._dispose_pool
+
+    def _dispose_pool(self, pool):
+        with self._lock:
+            self._discarded_connections += pool.num_connections
+            self._discarded_requests += pool.num_requests
+        pool.close()
+
+    def connection_stats(self):
+        with self._lock:
+            connections = self._discarded_connections
+            requests_sent = self._discarded_requests
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                requests_sent += pool.num_requests
+        return {
+            'requests': requests_sent,
+            'connections': connections,
+            'reused': max(requests_sent - connections, 0),
+        }
+
+
+class HTTPCache:
+    """A persistent cache of the responses to GET requests, stored in `directory`.
+
+    Entries are keyed by URL and user agent and keep the validators (ETag and
+    Last-Modified) of the response along with either its body or metadata derived
+    from it by the caller, such as the dimensions of an image. Responses without
+    validators are not cached as they can't be revalidated.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(url, user_agent):
+        return hashlib.sha256(f'{user_agent}\n{url}'.encode('UTF-8')).hexdigest()
+
+    def _path(self, key, extension):
+        return os.path.join(self.directory, key[:2], f'{key}.{extension}')
+
+    def _write(self, path, data):
+        # Concurrent readers never see a partially written entry.
+        with atomic_open(path) as outfile:
+            outfile.write(data)
+
+    def lookup(self, key):
+        """Return the entry stored for `key` (with its body, if any, under 'body') or None."""
+        try:
+            with open(self._path(key, 'json')) as infile:
+                entry = json.loads(infile.read())
+            if entry.get('has_body'):
+                with open(self._path(key, 'body'), 'rb') as infile:
+                    entry['body'] = infile.read()
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def store(self, response, body=None, meta=None):
+        """Store `response` under the key of its request along with its `body` and/or
+        `meta`, a JSON serializable dict. Returns whether the response could be cached."""
+        key = getattr(response, 'cache_key', None)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if key is None or response.status_code != 200 or not (etag or last_modified):
+            return False
+        entry = {
+            'url': response.url,
+            'status': response.status_code,
+            'headers': {name: value for name, value in response.headers.items()
+                        if name.lower() not in TRANSFER_HEADERS},
+            'etag': etag,
+            'last_modified': last_modified,
+            'meta': meta,
+            'has_body': body is not None,
+            'stored_at': time.time(),
+        }
+        if body is not None:
+            self._write(self._path(key, 'body'), body)
+        self._write(self._path(key, 'json'), json.dumps(entry).encode('UTF-8'))
+        return True
+
+    def count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key: while a call is in flight, the
+    calls made with its key wait for it and share its result (or exception) rather
+    than making the same requests again. `shared` is the number of calls that did."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.shared = 0
+
+    def do(self, key, function, *args, **kwargs):
+        """Return function(*args, **kwargs), or the result of the call in flight for `key`."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return flight.result()
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+
+class CrawlSession(requests.Session):
+    """A requests session shared by all the HTTP calls of a crawl so that connections
+    (and their TLS state) are kept alive and reused across sites hosted on the same
+    servers. `pool_connections` is the number of hosts for which connections are
+    pooled and `pool_maxsize` the number of connections kept alive per host; the
+    latter should be at least the number of threads using the session.
+
+    If a `cache` (an HTTPCache) is given, GET requests for URLs that are in the cache
+    are sent with If-None-Match/If-Modified-Since headers and a "304 Not Modified"
+    response is replaced by the cached response. Responses returned by the session
+    then have a `from_cache` flag and the `cache_meta` stored with the cached entry.
+    Non-streamed responses are cached with their body; callers that only read part of
+    a streamed response can cache what they derived from it with `cache.store`.
+
+    As streamed responses are read by one caller only, concurrent identical requests
+    are coalesced by the callers that make them, with the session's `flights` (a
+    SingleFlight) keyed by what they request.
+
+    If an `archive` (an http_archive.HTTPArchive) is given, requests are recorded to
+    it or replayed from it instead of being sent over the network.
+    """
+
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE, cache=None,
+                 archive=None):
+        super().__init__()
+        if archive is not None:
+            self.pooled_adapter = archive.adapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        else:
+            self.pooled_adapter = PooledAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.mount('http://', self.pooled_adapter)
+        self.mount('https://', self.pooled_adapter)
+        self.cache = cache
+        self.flights = SingleFlight()
+
+    def connection_stats(self):
+        return self.pooled_adapter.connection_stats()
+
+    def request(self, method, url, **kwargs):
+        if self.cache is None or method.upper() != 'GET':
+            return super().request(method, url, **kwargs)
+
+        headers = CaseInsensitiveDict(kwargs.get('headers') or {})
+        key = self.cache.key(url, headers.get('User-Agent', self.headers.get('User-Agent')))
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+            kwargs['headers'] = headers
+
+        response = super().request(method, url, **kwargs)
+        if entry is not None and response.status_code == 304:
+            response.close()
+            response = self._cached_response(entry, response)
+        else:
+            response.from_cache = False
+            response.cache_meta = None
+            response.cache_key = key
+            if not kwargs.get('stream'):
+                self.cache.store(response, body=response.content)
+        self.cache.count(response.from_cache)
+        return response
+
+    def _cached_response(self, entry, not_modified):
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.url = entry['url']
+        response.request = not_modified.request
+        response.reason = 'OK'
+        response._content = entry.get('body', b'')
+        response._content_consumed = True
+        response.from_cache = True
+        response.cache_meta = entry['meta']
+        response.cache_key = None
+        return response
@@ -0,0 +1,179 @@
+import re
+import struct
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+JPEG_SIGNATURE = b'\xff\xd8'
+GIF_SIGNATURES = (b'GIF87a', b'GIF89a')
+ICO_SIGNATURES = (b'\x00\x00\x01\x00', b'\x00\x00\x02\x00')
+# JPEG start of frame markers, which are followed by the dimensions of the image
+JPEG_SOF_MARKERS = frozenset(range(0xc0, 0xd0)) - {0xc4, 0xc8, 0xcc}
+# JPEG markers that are not followed by a segment length
+JPEG_STANDALONE_MARKERS = frozenset(range(0xd0, 0xda)) | {0x01}
+# Characters XML documents (such as SVG images) may start with
+XML_LEADING_CHARACTERS = b' \t\r\n'
+UTF8_BOM = b'\xef\xbb\xbf'
+
+SVG_TAG_PATTERN = re.compile(rb'<svg\b([^>]*)>', re.IGNORECASE)
+SVG_ATTRIBUTE_PATTERN = re.compile(rb'(?<![\w:.-])(width|height|viewBox)\s*=\s*(["\'])(.*?)\2', re.DOTALL)
+SVG_LENGTH_PATTERN = re.compile(rb'\s*([0-9]*\.?[0-9]+(?:[eE][+-]?[0-9]+)?)\s*(?:px)?\s*$')
+
+
+class UnsupportedImage(ValueError):
+    pass
+
+
+def get_image_size(data):
+    """Return the (format, width, height) of the image whose file starts with `data`,
+    reading only the header of the file. Returns None if `data` is too short to tell and
+    raises UnsupportedImage if the image is not a PNG, JPEG, GIF, WebP, ICO or SVG image
+    or if its header is invalid.
+
+    For ICO files the size of the largest image in the file is returned and for SVG
+    images the size is read from the width, height and viewBox attributes.
+    """
+    if len(data) < 12:
+        # Not enough data to recognize every format yet. Only an image that small could
+        # be complete, in which case it is too small to be valid anyway.
+        return None
+    if data.startswith(PNG_SIGNATURE):
+        return _png_size(data)
+    if data.startswith(JPEG_SIGNATURE):
+        return _jpeg_size(data)
+    if data.startswith(GIF_SIGNATURES):
+        return ('gif',) + struct.unpack_from('<HH', data, 6)
+    if data.startswith(b'RIFF') and data[8:12] == b'WEBP':
+        return _webp_size(data)
+    if data.startswith(ICO_SIGNATURES):
+        return _ico_size(data)
+    if _looks_like_xml(data):
+        return _svg_size(data)
+    raise UnsupportedImage('unknown image format')
+
+
+def _png_size(data):
+    offset = len(PNG_SIGNATURE)
+    # iOS optimized PNGs have a CgBI chunk before the IHDR chunk
+    if data[offset + 4:offset + 8] == b'CgBI':
+        offset += 12 + struct.unpack_from('>I', data, offset)[0]
+    if len(data) < offset + 16:
+        return None
+    if data[offset + 4:offset + 8] != b'IHDR':
+        raise UnsupportedImage('PNG image without IHDR chunk')
+    return ('png',) + struct.unpack_from('>II', data, offset + 8)
+
+
+def _jpeg_size(data):
+    offset = len(JPEG_SIGNATURE)
+    while True:
+        if offset >= len(data):
+            return None
+        if data[offset] != 0xff:
+            raise UnsupportedImage('invalid JPEG marker')
+        # Markers may be padded with any number of 0xff bytes
+        while offset < len(data) and data[offset] == 0xff:
+            offset += 1
+        if offset + 3 > len(data):
+            return None
+        marker = data[offset]
+        if marker in JPEG_STANDALONE_MARKERS:
+            offset += 1
+            continue
+        if marker in JPEG_SOF_MARKERS:
+            if offset + 8 > len(data):
+                return None
+            height, width = struct.unpack_from('>HH', data, offset + 4)
+            return ('jpeg', width, height)
+        offset += 1 + struct.unpack_from('>H', data, offset + 1)[0]
+
+
+def _webp_size(data):
+    if len(data) < 16:
+        return None
+    chunk = data[12:16]
+    if chunk == b'VP8 ':
+        if len(data) < 30:
+            return None
+        if data[23:26] != b'\x9d\x01\x2a':
+            raise UnsupportedImage('invalid VP8 frame')
+        width, height = struct.unpack_from('<HH', data, 26)
+        return ('webp', width & 0x3fff, height & 0x3fff)
+    if chunk == b'VP8L':
+        if len(data) < 25:
+            return None
+        if data[20] != 0x2f:
+            raise UnsupportedImage('invalid VP8L signature')
+        bits = struct.unpack_from('<I', data, 21)[0]
+        return ('webp', (bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1)
+    if chunk == b'VP8X':
+        if len(data) < 30:
+            return None
+        width = int.from_bytes(data[24:27], 'little') + 1
+        height = int.from_bytes(data[27:30], 'little') + 1
+        return ('webp', width, height)
+    raise UnsupportedImage('unknown WebP chunk')
+
+
+def _ico_size(data):
+    count = struct.unpack_from('<H', data, 4)[0]
+    if count == 0:
+        raise UnsupportedImage('ICO file without images')
+    if len(data) < 6 + count * 16:
+        return None
+    largest = (0, 0)
+    for offset in range(6, 6 + count * 16, 16):
+        # A width or height of 0 means 256 pixels
+        width = data[offset] or 256
+        height = data[offset + 1] or 256
+        if width * height > largest[0] * largest[1]:
+            largest = (width, height)
+    return ('ico',) + largest
+
+
+def _looks_like_xml(data):
+    if data.startswith(UTF8_BOM):
+        data = data[len(UTF8_BOM):len(UTF8_BOM) + 64]
+    return data[:64].lstrip(XML_LEADING_CHARACTERS).startswith(b'<')
+
+
+def _svg_size(data):
+    match = SVG_TAG_PATTERN.search(data)
+    if match is None:
+        if re.search(rb'<(?:html|body|head)\b', data, re.IGNORECASE):
+            raise UnsupportedImage('HTML document')
+        return None
+    attributes = {name.decode(): value for name, quote, value in SVG_ATTRIBUTE_PATTERN.findall(match.group(1))}
+    width = _svg_length(attributes.get('width'))
+    height = _svg_length(attributes.get('height'))
+    view_box = _svg_view_box(attributes.get('viewBox'))
+    if width is None or height is None:
+        if view_box is None:
+            raise UnsupportedImage('SVG image without dimensions')
+        view_box_width, view_box_height = view_box
+        if width is not None:
+            height = width * view_box_height / view_box_width
+        elif height is not None:
+            width = height * view_box_width / view_box_height
+        else:
+            width, height = view_box
+    return ('svg', round(width), round(height))
+
+
+def _svg_length(value):
+    # Only lengths in user units (pixels) can be used, relative lengths such as 100% can't
+    if value is None:
+        return None
+    match = SVG_LENGTH_PATTERN.match(value)
+    return float(match.group(1)) if match else None
+
+
+def _svg_view_box(value):
+    if value is None:
+        return None
+    try:
+        width, height = (float(x) for x in value.replace(b',', b' ').split()[2:])
+    except ValueError:
+        return None
+    if width <= 0 or height <= 0:
+        return None
+    return (width, height)
@@ -1,25 +1,61 @@
+import asyncio
+import hashlib
+import heapq
 import json
 import logging
+import os
 import re
+import shutil
+import tempfile
+import threading
+import time
 import zipfile
 import csv
-from io import BytesIO, StringIO
-from urllib.parse import urljoin
+from collections import OrderedDict, deque
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from io import BytesIO, TextIOWrapper
+from itertools import islice
+from textwrap import indent
+from urllib.parse import urlparse, urlsplit, urlunsplit
 
 import click
 import requests
 from PIL import Image
-from robobrowser import RoboBrowser
 
-from nsfw import is_nsfw
+from html_icons import IconParser, parse_head
+from http_archive import HTTPArchive
+from http_session import CrawlSession, HTTPCache, DEFAULT_POOL_MAXSIZE, atomic_open
+from image_size import get_image_size, UnsupportedImage
+from nsfw import nsfw_domains
+from public_suffix import parent_domains
 
 
-LINK_SELECTOR = 'link[rel=apple-touch-icon], link[rel=apple-touch-icon-precomposed], link[rel="icon shortcut"], link[rel="shortcut icon"], link[rel="icon"], link[rel="SHORTCUT ICON"], link[rel="fluid-icon"]'
-META_SELECTOR = 'meta[name=apple-touch-icon]'
 FIREFOX_UA = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.12; rv:58.0) Gecko/20100101 Firefox/58.0'
 IPHONE_UA = 'Mozilla/5.0 (iPhone; CPU iPhone OS 10_2_1 like Mac OS X) AppleWebKit/602.4.6 (KHTML, like Gecko) Version/10.0 Mobile/14D27 Safari/602.1'
 ALEXA_DATA_URL = 'http://s3.amazonaws.com/alexa-static/top-1m.csv.zip'
 SVG_ICON_WIDTH = "SVG_ICON_WIDTH"
+# Icons are downloaded in chunks of this size until their dimensions are known
+PROBE_CHUNK_SIZE = 1024
+# Number of bytes of an icon after which probing gives up and the whole icon is downloaded
+PROBE_MAX_BYTES = 64 * 1024
+# A size in the sizes attribute of an icon
+SIZE_PATTERN = re.compile(r'^([0-9]+)[xX]([0-9]+)$')
+# A size in the filename of an icon, as in android-icon-192x192.png or icon-192-192.png
+FILENAME_SIZE_PATTERN = re.compile(r'(?<![0-9])([0-9]{2,4})[xX-]([0-9]{2,4})(?![0-9])')
+# Rank of the kinds of icons (their rel, or name for <meta> tags) in the order in which
+# they are downloaded, from the kinds that are usually the largest to favicons
+ICON_PROBE_RANKS = {
+    'apple-touch-icon': 0,
+    'apple-touch-icon-precomposed': 0,
+    'fluid-icon': 1,
+    'icon': 2,
+}
+# Number of icons whose width is remembered across the sites of a crawl
+ICON_WIDTHS_MAXSIZE = 100000
+# Number of documents whose icons are remembered across the sites of a crawl
+CRAWLED_PAGES_MAXSIZE = 10000
 # Domains we want to exclude
 DOMAIN_EXCLUSION_LIST = [
     "higheurest.com",
@@ -34,18 +70,84 @@ DOMAIN_EXCLUSION_LIST = [
     "fedsit.com",
     "vebadu.com"
 ]
+DOMAIN_EXCLUSIONS = frozenset(DOMAIN_EXCLUSION_LIST)
 
 logging.basicConfig(filename='debug.log',level=logging.INFO)
 
 
-def _fetch_alexa_top_sites():
-    r = requests.get(ALEXA_DATA_URL, timeout=60)
-    z = zipfile.ZipFile(BytesIO(r.content))
-    rows = StringIO(z.read('top-1m.csv').decode('UTF-8'))
+def _parse_alexa_top_sites(rows):
     for row in rows:
         rank, domain = row.split(',')
         yield (int(rank), domain.strip())
 
+def _fetch_alexa_top_sites(session=None):
+    # The archive is spooled to disk rather than memory and the list is decompressed
+    # and decoded lazily, so only the rows that are consumed are ever read.
+    http = session or requests
+    with tempfile.TemporaryFile() as archive:
+        with http.get(ALEXA_DATA_URL, timeout=60, stream=True) as r:
+            r.raise_for_status()
+            for chunk in r.iter_content(64 * 1024):
+                archive.write(chunk)
+        with zipfile.ZipFile(archive) as z, z.open('top-1m.csv') as member:
+            yield from _parse_alexa_top_sites(TextIOWrapper(member, encoding='UTF-8'))
+
+def _refresh_alexa_top_sites(path, info, session=None):
+    # Download the list again unless it hasn't changed since it was cached. The list is
+    # cached uncompressed, with one "rank,domain" row per line in rank order, so that
+    # reading the top sites doesn't involve the archive.
+    headers = {}
+    if info:
+        if info.get('etag'):
+            headers['If-None-Match'] = info['etag']
+        if info.get('last_modified'):
+            headers['If-Modified-Since'] = info['last_modified']
+    http = session or requests
+    with http.get(ALEXA_DATA_URL, headers=headers, timeout=60, stream=True) as r:
+        if info and r.status_code == 304:
+            logging.info('Cached top sites list is up to date')
+            return dict(info, fetched_at=time.time())
+        r.raise_for_status()
+        logging.info('Caching top sites list')
+        with tempfile.TemporaryFile() as archive:
+            for chunk in r.iter_content(64 * 1024):
+                archive.write(chunk)
+            with zipfile.ZipFile(archive) as z, z.open('top-1m.csv') as member:
+                with atomic_open(path) as outfile:
+                    shutil.copyfileobj(member, outfile)
+        return {
+            'etag': r.headers.get('ETag'),
+            'last_modified': r.headers.get('Last-Modified'),
+            'fetched_at': time.time()
+        }
+
+def _fetch_cached_alexa_top_sites(cache_dir, max_age, session=None):
+    # The list is only revalidated once it is older than max_age (a timedelta). If that
+    # fails the cached list is used anyway.
+    path = os.path.join(cache_dir, 'top-1m.csv')
+    info_path = os.path.join(cache_dir, 'top-1m.json')
+    os.makedirs(cache_dir, exist_ok=True)
+    info = None
+    if os.path.exists(path):
+        try:
+            with open(info_path) as infile:
+                info = json.loads(infile.read())
+        except (OSError, ValueError):
+            # A list whose info is missing or unreadable is downloaded again.
+            info = None
+    if info is None or time.time() - info['fetched_at'] > max_age.total_seconds():
+        try:
+            info = _refresh_alexa_top_sites(path, info, session)
+        except Exception as e:
+            if info is None:
+                raise
+            logging.info(f'Exception: "{str(e)}" while refreshing the top sites list, using the cached list')
+        else:
+            with atomic_open(info_path, 'w') as outfile:
+                json.dump(info, outfile)
+    with open(path, encoding='UTF-8') as rows:
+        yield from _parse_alexa_top_sites(rows)
+
 def _fetch_top_sites(topsitesfile):
     with open(topsitesfile, newline='') as csvfile:
         rows = csv.reader(csvfile)
@@ -55,14 +157,17 @@ def _fetch_top_sites(topsitesfile):
                 continue
             yield (row[0], row[1])
 
-def top_sites(topsitesfile, count):
+def top_sites(topsitesfile, count, cache_dir=None, max_age=timedelta(days=1), session=None):
     logging.info(f'Fetching top {count} sites')
     top_sites_generator = None
     if topsitesfile:
         top_sites_generator = _fetch_top_sites(topsitesfile)
+    elif cache_dir:
+        top_sites_generator = _fetch_cached_alexa_top_sites(cache_dir, max_age, session)
     else:
-        top_sites_generator = _fetch_alexa_top_sites()
-    return [next(top_sites_generator) for x in range(count)]
+        top_sites_generator = _fetch_alexa_top_sites(session)
+    with closing(top_sites_generator):
+        return list(islice(top_sites_generator, count))
 
 def extra_sites(extrafile):
     logging.info(f'Fetching extra sites')
@@ -70,50 +175,107 @@ def extra_sites(extrafile):
     extra_sites_generator = _fetch_top_sites(extrafile)
     return list(extra_sites_generator)
 
-def is_url_reachable(url):
+def coalesced(session, key, function, *args):
+    """Return function(*args), sharing the result of an identical call (one with the
+    same `key`, made for the same url and user agent) that is in flight through
+    `session` if it is a CrawlSession, rather than making the same requests again."""
+    flights = getattr(session, 'flights', None)
+    if flights is None:
+        return function(*args)
+    return flights.do(key, function, *args)
+
+def is_url_reachable(url, session=None):
+    return coalesced(session, ('reachable', url, FIREFOX_UA), _is_url_reachable, url, session)
+
+def _is_url_reachable(url, session):
+    http = session or requests
     try:
-        response = requests.get(url, headers={'User-agent': FIREFOX_UA}, timeout=60)
+        response = http.get(url, headers={'User-agent': FIREFOX_UA}, timeout=60)
         return True if response.status_code == 200 else False
     except Exception as e:
         logging.info(f'Exception: "{str(e)}" while checking if "{url}" is reachable or not')
         return False
 
-def fetch_icons(url, user_agent=IPHONE_UA):
+def probe_default_favicon(url, session=None):
+    """Return whether the favicon at `url` is reachable (like is_url_reachable) along
+    with its width (see probe_icon_width), which is measured from the same response so
+    that the favicon doesn't have to be downloaded again to be sized."""
+    return coalesced(session, ('favicon', url, FIREFOX_UA), _probe_default_favicon, url, session)
+
+def _probe_default_favicon(url, session):
+    http = session or requests
+    try:
+        with http.get(url, headers={'User-agent': FIREFOX_UA}, timeout=60, stream=True) as response:
+            if response.status_code != 200:
+                return (False, None)
+            try:
+                return (True, response_icon_width(response, getattr(session, 'cache', None)))
+            except Exception as e:
+                logging.info(f'Exception: "{str(e)}" fetching (or opening) icon {url}')
+                return (True, None)
+    except Exception as e:
+        logging.info(f'Exception: "{str(e)}" while checking if "{url}" is reachable or not')
+        return (False, None)
+
+def fetch_declared_icons(url, user_agent=IPHONE_UA, session=None, page=None):
+    """Return the icons declared by the document at `url`. If a `page` dict is given,
+    the final url of the document (after redirects) and the digest of its head (see
+    parse_head) are set in it under 'url' and 'digest' once it has been parsed."""
+    icons, parsed = coalesced(session, ('document', url, user_agent), _fetch_declared_icons, url, user_agent, session)
+    if page is not None and parsed:
+        page.update(parsed)
+    return icons
+
+def _fetch_declared_icons(url, user_agent, session):
     logging.info(f'Fetching icons for {url}')
-    icons = []
-    browser = RoboBrowser(user_agent=user_agent, parser='html.parser')
+    http = session or requests
+    cache = getattr(session, 'cache', None)
+    parser = IconParser(url)
+    parsed = None
     try:
-        browser.open(url, timeout=60)
-        for link in browser.select(LINK_SELECTOR):
-            icon = link.attrs
-            icon_url = icon['href']
-            if icon_url.startswith('data:'):
-                continue
-            if not icon_url.startswith('http') and not icon_url.startswith('//'):
-                icon['href'] = urljoin(browser.url, icon_url)
-            icons.append(icon)
-        for meta in browser.select(META_SELECTOR):
-            icon = meta.attrs
-            icon_url = icon['content']
-            if icon_url.startswith('data:'):
-                continue
-            if not icon_url.startswith('http') and not icon_url.startswith('//'):
-                icon['href'] = urljoin(browser.url, icon_url)
+        # Only the head of the document is downloaded and parsed, see parse_head.
+        with http.get(url, headers={'User-Agent': user_agent}, timeout=60, stream=True) as response:
+            meta = getattr(response, 'cache_meta', None)
+            if meta and 'icons' in meta:
+                icons = meta['icons']
+                digest = meta.get('digest')
             else:
-                icon['href'] = icon_url
-            icons.append(icon)
+                parser.base_url = response.url
+                digest = parse_head(response, parser)
+                icons = parser.icons
+                if cache is not None:
+                    cache.store(response, meta={'icons': icons, 'digest': digest})
+            if digest:
+                parsed = {'url': response.url, 'digest': digest}
     except Exception as e:
         logging.info(f'Exception: "{str(e)}" while parsing icon urls from document')
-        pass
+        icons = parser.icons
+    return (icons, parsed)
+
+def fetch_default_favicon(url, session=None, icon_widths=None):
+    """Return the icons of the site at `url` if it only has a "favicon.ico" file in its
+    root, that is a list with that icon if it is reachable and an empty list otherwise.
+    If an `icon_widths` dict is given, the width of the favicon is added to it."""
+    default_favicon_url = f"{url}/favicon.ico"
+    reachable, width = probe_default_favicon(default_favicon_url, session)
+    if not reachable:
+        return []
+    if icon_widths is not None:
+        icon_widths[default_favicon_url] = width
+    return [{"href": default_favicon_url}]
+
+def fetch_icons(url, user_agent=IPHONE_UA, session=None, icon_widths=None):
+    """Return the icons declared by the document at `url`, or its default favicon if
+    it declares none. If an `icon_widths` dict is given, the widths of the icons that
+    had to be downloaded to find them are added to it by URL (see resolve_best_icon)."""
+    icons = fetch_declared_icons(url, user_agent, session)
 
     # If the document doesn't specify favicon via rel attribute of link tag then check
     # if "favicon.ico" file is present in the root of the domain as some domains keep
     # favicon in their root without specifying them in the document.
     # Add the icon url if this is the case.
     if len(icons) == 0:
-        default_favicon_url = f"{url}/favicon.ico"
-        if is_url_reachable(default_favicon_url):
-            icons.append({"href": default_favicon_url})
+        icons = fetch_default_favicon(url, session, icon_widths)
 
     return icons
 
@@ -124,123 +286,815 @@ def fix_url(url):
     return fixed
 
 
-def get_best_icon(images):
-    image_url = None
-    image_width = 0
-    for image in images:
-        url = fix_url(image.get('href'))
-        width = None
-        sizes = image.get('sizes')
-        if sizes:
+def fetch_image_size(response):
+    """Return the (format, width, height) of the image of the streamed `response`.
+
+    The download stops as soon as the dimensions can be read from the header of the
+    image (see image_size.get_image_size), which for most icons is within the first
+    few hundred bytes. Otherwise, or if they are still unknown after PROBE_MAX_BYTES,
+    the rest of the image is downloaded and opened with Pillow, and the format is the
+    lowercased name Pillow gives it.
+    """
+    data = bytearray()
+    # The rest of the image is read from where probing stopped: iterating over the
+    # content again would start over from the first byte of a body that was read
+    # beforehand, as that of a response from the cache or an HTTP archive.
+    chunks = response.iter_content(PROBE_CHUNK_SIZE)
+    for chunk in chunks:
+        data += chunk
+        try:
+            size = get_image_size(data)
+        except UnsupportedImage as e:
+            logging.info(f'Cannot read the size of icon {response.url} from its header: {str(e)}')
+            break
+        if size is not None:
+            return size
+        if len(data) >= PROBE_MAX_BYTES:
+            break
+
+    for chunk in chunks:
+        data += chunk
+    with Image.open(BytesIO(data)) as img:
+        return ((img.format or '').lower(),) + img.size
+
+def fetch_cached_image_size(response, cache=None):
+    """Like fetch_image_size, but if `response` was revalidated from the HTTP cache the
+    dimensions stored with it are returned instead and otherwise they are stored."""
+    meta = getattr(response, 'cache_meta', None)
+    if meta and 'size' in meta:
+        return (meta.get('format'),) + tuple(meta['size'])
+    image_format, width, height = fetch_image_size(response)
+    if cache is not None:
+        cache.store(response, meta={'format': image_format, 'size': [width, height]})
+    return (image_format, width, height)
+
+def declared_icon_width(image):
+    """Return the width of the icon `image` as declared by its attributes, without
+    downloading it: the largest of its sizes (as in sizes="16x16 32x32"), SVG_ICON_WIDTH
+    if it claims to be scalable (sizes="any" or an SVG type or file), the size hinted at
+    by its filename (as in android-icon-192x192.png) or None if none of them says.
+
+    Scalable icons still have to be downloaded to check that they are SVG images."""
+    sizes = image.get('sizes') or ''
+    widths = [int(match.group(1)) for match in map(SIZE_PATTERN.match, sizes.split()) if match]
+    if widths:
+        return max(widths)
+    try:
+        path = urlparse(image.get('href', '')).path.lower()
+    except ValueError:
+        # Nothing is declared by a url that can't be parsed, like https://[cdn.a.com/i.png
+        return None
+    if 'any' in sizes.lower().split() or image.get('type') == 'image/svg+xml' or path.endswith('.svg'):
+        return SVG_ICON_WIDTH
+    match = FILENAME_SIZE_PATTERN.search(path.rsplit('/', 1)[-1])
+    if match and match.group(1) == match.group(2):
+        return int(match.group(1))
+    return None
+
+def response_icon_width(response, cache=None):
+    """Return SVG_ICON_WIDTH if the streamed `response` is an SVG image and the smaller
+    of the dimensions of its image otherwise (see fetch_cached_image_size)."""
+    if response.headers.get('Content-Type') == 'image/svg+xml':
+        if cache is not None:
+            cache.store(response)
+        return SVG_ICON_WIDTH
+    image_format, width, height = fetch_cached_image_size(response, cache)
+    if image_format == 'svg':
+        # Served with another Content-Type, such as image/svg+xml; charset=utf-8. Its
+        # width and height are in user units, which don't say how large it can be drawn.
+        return SVG_ICON_WIDTH
+    if width != height:
+        logging.info(f'icon shape "{width}*{height}" is not square')
+        width = min(width, height)
+    return width
+
+def probe_icon_width(url, session=None):
+    """Download the icon at `url` and return SVG_ICON_WIDTH if it is an SVG image, the
+    smaller of its dimensions otherwise or None if it can't be fetched or opened."""
+    return coalesced(session, ('icon', url, FIREFOX_UA), _probe_icon_width, url, session)
+
+def _probe_icon_width(url, session):
+    http = session or requests
+    try:
+        # Closing the streamed response stops the download once the size is known.
+        with http.get(url, headers={'User-agent': FIREFOX_UA}, timeout=60, stream=True) as response:
+            return response_icon_width(response, getattr(session, 'cache', None))
+    except Exception as e:
+        logging.info(f'Exception: "{str(e)}" fetching (or opening) icon {url}')
+        return None
+
+def icon_probe_order(image):
+    """Return the sort key of the icon `image` in the order in which the icons that
+    don't declare their width are downloaded, the ones that are usually the largest
+    first (see ICON_PROBE_RANKS)."""
+    kind = ' '.join(image.get('rel', [])) or image.get('name')
+    return ICON_PROBE_RANKS.get(kind, len(ICON_PROBE_RANKS))
+
+def probe_icon_widths(urls, session=None, concurrency=1):
+    """Generate the probe_icon_width of each of `urls` in order, downloading up to
+    `concurrency` of the icons at a time. The downloads that haven't started yet when
+    the generator is closed are cancelled."""
+    if concurrency <= 1:
+        for url in urls:
+            yield probe_icon_width(url, session)
+        return
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        futures = [executor.submit(probe_icon_width, url, session) for url in urls]
+        for future in futures:
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def canonical_icon_url(url):
+    """Return `url` without its fragment and with its scheme and host in lower case and
+    without the default port of its scheme, so that the spellings of the url of an
+    icon share the same width in IconWidths."""
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        # Urls that can't be parsed, like https://[cdn.a.com/i.png, are kept as they are.
+        return url
+    netloc = parts.hostname or ''
+    if ':' in netloc:
+        netloc = f'[{netloc}]'
+    if port and (parts.scheme.lower(), port) not in (('http', 80), ('https', 443)):
+        netloc = f'{netloc}:{port}'
+    return urlunsplit((parts.scheme.lower(), netloc, parts.path or '/', parts.query, ''))
+
+class IconWidths:
+    """The widths of the icons measured so far by canonical url (see canonical_icon_url),
+    keeping the `maxsize` most recently used ones, loaded from and saved to `path`."""
+
+    def __init__(self, maxsize=ICON_WIDTHS_MAXSIZE, path=None, max_age=timedelta(days=7)):
+        self.maxsize = maxsize
+        self.path = path
+        self._lock = threading.Lock()
+        # Canonical url -> (width, time it was measured at), least recently used first
+        self._widths = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path:
+            # Widths measured more than max_age ago are measured again.
+            self._load(time.time() - max_age.total_seconds())
+
+    def _load(self, oldest):
+        try:
+            with open(self.path) as infile:
+                entries = json.loads(infile.read())
+        except (OSError, ValueError):
+            return
+        for url, entry in entries.items():
+            if entry['measured_at'] >= oldest:
+                width = SVG_ICON_WIDTH if entry['svg'] else entry['width']
+                self._widths[url] = (width, entry['measured_at'])
+        while len(self._widths) > self.maxsize:
+            self._widths.popitem(last=False)
+
+    def get(self, url, default=None):
+        key = canonical_icon_url(url)
+        with self._lock:
+            entry = self._widths.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._widths.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def __setitem__(self, url, width):
+        key = canonical_icon_url(url)
+        with self._lock:
+            self._widths[key] = (width, time.time())
+            self._widths.move_to_end(key)
+            while len(self._widths) > self.maxsize:
+                self._widths.popitem(last=False)
+
+    def save(self):
+        """Save the widths of the icons that could be measured to `path`."""
+        # Icons that couldn't be fetched are measured again, as that is often temporary.
+        with self._lock:
+            entries = {url: {'width': None if width == SVG_ICON_WIDTH else width,
+                             'svg': width == SVG_ICON_WIDTH,
+                             'measured_at': measured_at}
+                       for url, (width, measured_at) in self._widths.items() if width is not None}
+        with atomic_open(self.path, 'w') as outfile:
+            outfile.write(json.dumps(entries))
+
+def resolve_best_icon(images, session=None, target_width=None, concurrency=1, icon_widths=None):
+    """Return the (url, width) of the best icon of `images` and the number of them that
+    didn't have to be downloaded."""
+    # Icons are only downloaded when what they declare doesn't settle which one is the best.
+    candidates = [(image, fix_url(image.get('href')), declared_icon_width(image)) for image in images]
+    # Icons already downloaded for another site (by url in icon_widths) aren't downloaded again.
+    known = {}
+    if icon_widths is not None:
+        missing = object()
+        for index, (image, url, declared) in enumerate(candidates):
+            if declared is None or declared == SVG_ICON_WIDTH:
+                width = icon_widths.get(url, missing)
+                if width is not missing:
+                    known[index] = width
+    probed = {}
+    downloads = 0
+
+    def probe(indexes):
+        # Up to `concurrency` icons are downloaded at a time but their widths are looked
+        # at in order, so that the best icon doesn't depend on which download ends first.
+        return closing(probe_icon_widths([candidates[index][1] for index in indexes if index not in known],
+                                         session, concurrency))
+
+    def width_of(index, results):
+        nonlocal downloads
+        if index in known:
+            return known[index]
+        downloads += 1
+        width = next(results)
+        if icon_widths is not None:
+            icon_widths[candidates[index][1]] = width
+        return width
+
+    # If it is an SVG, then it is the best icon because SVG images are scalable, can be
+    # printed with high quality at any resolution and SVG graphics do NOT lose any
+    # quality if they are zoomed or resized. Firefox doesn't support masked icons yet.
+    scalable = [index for index, (image, url, declared) in enumerate(candidates)
+                if declared == SVG_ICON_WIDTH and 'mask' not in image]
+    with probe(scalable) as results:
+        for index in scalable:
+            width = probed[index] = width_of(index, results)
+            if width == SVG_ICON_WIDTH:
+                # If it is not masked then we want it. We are done here.
+                return (candidates[index][1], SVG_ICON_WIDTH, len(candidates) - downloads)
+
+    widths = dict(probed)
+    widths.update((index, declared) for index, (image, url, declared) in enumerate(candidates)
+                  if declared not in (None, SVG_ICON_WIDTH))
+    # Otherwise it is the widest icon. The icons that are likely the widest are downloaded
+    # first, and once one is at least target_width wide the others aren't downloaded.
+    unknown = sorted((index for index in range(len(candidates)) if index not in widths),
+                     key=lambda index: (icon_probe_order(candidates[index][0]), index))
+    with probe(unknown) as results:
+        for index in unknown:
+            if target_width is not None and any(width and width >= target_width for width in widths.values()):
+                break
+            image, url, declared = candidates[index]
+            width = probed[index] = width_of(index, results)
+            if width == SVG_ICON_WIDTH:
+                if 'mask' not in image:
+                    return (url, SVG_ICON_WIDTH, len(candidates) - downloads)
+                logging.info(f'SVG icon "{image}" is masked')
+                continue
+            widths[index] = width
+
+    # The first of the widest icons, in the order of `images`.
+    best = min((index for index, width in widths.items() if width),
+               key=lambda index: (-widths[index], index), default=None)
+    if best is None:
+        return (None, 0, len(candidates) - downloads)
+    return (candidates[best][1], widths[best], len(candidates) - downloads)
+
+def get_best_icon(images, session=None, target_width=None):
+    image_url, image_width, _ = resolve_best_icon(images, session, target_width)
+    return (image_url, image_width)
+
+def first_success(probes, stagger):
+    """Return the index and result of the first of `probes` (functions that return None
+    when they fail) that succeeds, or (None, None) if none does."""
+    if stagger is None:
+        for index, probe in enumerate(probes):
+            result = probe()
+            if result is not None:
+                return (index, result)
+        return (None, None)
+
+    # Rather than waiting for a probe to fail, the next one is started `stagger` seconds
+    # after it, with the same result as calling them one after the other. Probes that
+    # haven't started once it is known are cancelled, the others end in the background.
+    lock = threading.Lock()
+    # Index of the first probe known to succeed: the probes after it are not needed.
+    settled = [len(probes)]
+    wake = [threading.Event() for _ in probes]
+
+    def speculate(index):
+        # A probe starts when its turn comes or as soon as the probe before it failed.
+        wake[index].wait(index * stagger)
+        with lock:
+            if settled[0] < index:
+                return None
+        result = probes[index]()
+        if result is None:
+            if index + 1 < len(probes):
+                wake[index + 1].set()
+        else:
+            with lock:
+                settled[0] = min(settled[0], index)
+        return result
+
+    executor = ThreadPoolExecutor(max_workers=max(len(probes), 1))
+    try:
+        futures = [executor.submit(speculate, index) for index in range(len(probes))]
+        for index, future in enumerate(futures):
+            result = future.result()
+            if result is not None:
+                return (index, result)
+        return (None, None)
+    finally:
+        with lock:
+            settled[0] = -1
+        for event in wake:
+            event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def fetch_site_icons(hostname, session=None, icon_widths=None, stagger=None):
+    """Return the url of the site `hostname`, its icons (see fetch_icons) and the page
+    dict (see fetch_declared_icons) of the document that declared them, if any. If the
+    document at https://hostname declares no icon and the site has no default favicon,
+    https://www.hostname is tried too as some domains require it explicitly.
+
+    If a `stagger` is given, each of these probes is started speculatively `stagger`
+    seconds after the previous one (see first_success) so that a site that doesn't
+    answer doesn't cost one timeout after the other.
+    """
+    urls = ['https://{hostname}'.format(hostname=hostname)]
+    if 'www.' not in hostname:
+        urls.append(f"https://www.{hostname}")
+    pages = {url: {} for url in urls}
+    probes = []
+    for url in urls:
+        probes.append(lambda url=url: fetch_declared_icons(url, session=session, page=pages[url]) or None)
+        probes.append(lambda url=url: fetch_default_favicon(url, session, icon_widths) or None)
+    index, icons = first_success(probes, stagger)
+    if index is None:
+        return (urls[-1], [], None)
+    url = urls[index // 2]
+    # A default favicon depends on the url of the site rather than on its document.
+    return (url, icons, pages[url] if index % 2 == 0 else None)
+
+class CrawledPages:
+    """The icons and best icon of the `maxsize` documents most recently crawled, by final
+    url (after redirects) and digest of their head."""
+
+    def __init__(self, maxsize=CRAWLED_PAGES_MAXSIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._pages = OrderedDict()
+        self.reused = 0
+
+    def get(self, page):
+        """Return the (icons, best_icon_url, best_icon_width) of the document `page`."""
+        key = (page['url'], page['digest'])
+        with self._lock:
+            crawled = self._pages.get(key)
+            if crawled is not None:
+                self._pages.move_to_end(key)
+                self.reused += 1
+            return crawled
+
+    def add(self, page, icons, best_icon_url, best_icon_width):
+        key = (page['url'], page['digest'])
+        with self._lock:
+            self._pages.setdefault(key, (icons, best_icon_url, best_icon_width))
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.maxsize:
+                self._pages.popitem(last=False)
+
+def crawl_site(rank, hostname, session=None, target_width=None, icon_concurrency=1, stagger=None, pages=None,
+               icon_widths=None):
+    if icon_widths is None:
+        icon_widths = {}
+    url, icons, page = fetch_site_icons(hostname, session, icon_widths, stagger)
+
+    crawled = pages.get(page) if pages is not None and page else None
+    if crawled is not None:
+        # The site redirects to a document that was already crawled for another site,
+        # like the regional domains of a store that redirect to the same storefront.
+        icons, best_icon_url, best_icon_width = crawled
+        downloads_avoided = len(icons)
+    else:
+        best_icon_url, best_icon_width, downloads_avoided = resolve_best_icon(icons, session, target_width,
+                                                                              icon_concurrency, icon_widths)
+        if pages is not None and page:
+            pages.add(page, icons, best_icon_url, best_icon_width)
+    return {
+        'hostname': hostname,
+        'url': url,
+        'icons': icons,
+        'rank': rank,
+        'best_icon_url': best_icon_url,
+        'best_icon_width': best_icon_width,
+        'downloads_avoided': downloads_avoided,
+        'fetched_at': datetime.now(timezone.utc).isoformat(timespec='seconds')
+    }
+
+async def _crawl_sites(sites, concurrency, session, target_width, icon_concurrency, stagger, pages, icon_widths):
+    # Sites are crawled on a pool of `concurrency` threads while the results are
+    # yielded in the order of `sites`. Only a bounded window of sites is in flight
+    # at any time so that memory doesn't grow with the number of sites.
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    sites = iter(sites)
+    pending = deque()
+
+    def schedule(count):
+        for rank, hostname in islice(sites, count):
+            pending.append(loop.run_in_executor(executor, crawl_site, rank, hostname, session,
+                                                   target_width, icon_concurrency, stagger, pages,
+                                                   icon_widths))
+
+    try:
+        schedule(concurrency * 4)
+        while pending:
+            result = await pending.popleft()
+            schedule(1)
+            yield result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def iter_crawl_results(sites, concurrency=1, session=None, target_width=None, icon_concurrency=1, stagger=None,
+                       pages=None, icon_widths=None):
+    """Crawl (rank, hostname) pairs with at most `concurrency` sites in flight and
+    yield their result dicts in the same order as `sites`. The icons of each site are
+    downloaded `icon_concurrency` at a time and its urls are probed speculatively if a
+    `stagger` is given (see fetch_site_icons). If `pages` (a CrawledPages) is given,
+    sites whose document was already crawled reuse its icons, and if `icon_widths` (an
+    IconWidths) is given, icons that were already sized for another site are not
+    downloaded again."""
+    loop = asyncio.new_event_loop()
+    results = _crawl_sites(sites, concurrency, session, target_width, icon_concurrency, stagger, pages,
+                           icon_widths)
+    try:
+        while True:
             try:
-                width = int(sizes.split('x')[0])
-            except:
-                pass
-        if width is None:
+                yield loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(results.aclose())
+        loop.close()
+
+def shard_of(hostname, total):
+    """Return the (0-based) shard out of `total` shards that `hostname` belongs to.
+    The assignment only depends on the hostname so it is stable across runs and machines."""
+    digest = hashlib.md5(hostname.encode('UTF-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % total
+
+def parse_shard(ctx, param, value):
+    if value is None:
+        return None
+    try:
+        index, total = (int(x) for x in value.split('/'))
+    except ValueError:
+        raise click.BadParameter('shard must be of the form INDEX/TOTAL, e.g. 1/4')
+    if not 1 <= index <= total:
+        raise click.BadParameter(f'shard index must be between 1 and {total}')
+    return (index, total)
+
+def _position(site):
+    if 'position' not in site:
+        raise ValueError(f'"{site.get("hostname")}" was not saved by a sharded crawl')
+    return site['position']
+
+def merge_shards(shards):
+    """Merge the raw site data of all the shards of a crawl into the raw site data of
+    the whole crawl, with the sites in the order an unsharded crawl would have them.
+    The sites of each shard are in crawl order so they are merged as they are read."""
+    previous = None
+    for site in heapq.merge(*shards, key=_position):
+        if previous is not None and previous['position'] == site['position']:
+            raise ValueError(f'"{previous["hostname"]}" and "{site["hostname"]}" were crawled at the same '
+                             'position; the shards are not from the same crawl')
+        previous = site
+        yield {key: value for key, value in site.items() if key != 'position'}
+
+def has_usable_icon(site, minwidth):
+    """Return whether the best icon of `site` can be used in the manifest, that is
+    whether it is an SVG or at least `minwidth` wide."""
+    icon_width = site.get('best_icon_width')
+    return site.get('best_icon_url') is not None and (icon_width == SVG_ICON_WIDTH or icon_width >= minwidth)
+
+def reusable_sites(previous_sites, max_age, minwidth=0):
+    """Return the sites of a previous crawl that don't need to be crawled again, by
+    hostname: those that have a usable icon (see has_usable_icon) and were crawled
+    less than `max_age` (a timedelta) ago. Sites saved without their crawl time are
+    always crawled again."""
+    oldest = datetime.now(timezone.utc) - max_age
+    reusable = {}
+    for site in previous_sites:
+        fetched_at = site.get('fetched_at')
+        if has_usable_icon(site, minwidth) and fetched_at and datetime.fromisoformat(fetched_at) >= oldest:
+            reusable[site['hostname']] = site
+    return reusable
+
+def load_raw_site_data(filename):
+    """Yield the sites of the raw site data saved in `filename`. Files with one JSON
+    record per line (see save_raw_site_data) are read one site at a time while files
+    with a JSON array of sites are read as a whole. A record that was only partly
+    written is skipped."""
+    with open(filename) as infile:
+        for line in infile:
+            if not line.strip():
+                continue
+            if line.lstrip().startswith('['):
+                infile.seek(0)
+                yield from json.loads(infile.read())
+                return
             try:
-                response = requests.get(url, headers={'User-agent': FIREFOX_UA}, timeout=60)
-
-                # If it is an SVG, then return this as the best icon because SVG images are scalable,
-                # can be printed with high quality at any resolution and SVG graphics do NOT
-                # lose any quality if they are zoomed or resized.
-                if response.headers.get('Content-Type') == 'image/svg+xml':
-                    # Firefox doesn't support masked icons yet.
-                    if 'mask' not in image:
-                        # If it is not then we want it. We are done here.
-                        return (url, SVG_ICON_WIDTH)
-                    else:
-                        logging.info(f'SVG icon "{image}" is masked')
-                        continue
-                with Image.open(BytesIO(response.content)) as img:
-                    width, height = img.size
-                    if width != height:
-                        logging.info(f'icon shape "{width}*{height}" is not square')
-                        width = min(width, height)
-            except Exception as e:
-                logging.info(f'Exception: "{str(e)}" fetching (or opening) icon {url}')
-                pass
-        if width and width > image_width:
-            image_url = url
-            image_width = width
+                site = json.loads(line)
+            except ValueError:
+                logging.info(f'Skipping incomplete record "{line.strip()}" of {filename}')
+                continue
+            yield site
 
-    return (image_url, image_width)
+def save_raw_site_data(sites, filename):
+    """Save `sites` to `filename` one site at a time as they are generated, yielding
+    each site once it is saved. Sites are saved with one JSON record per line if the
+    filename ends with .jsonl and as an (indented) JSON array otherwise. The file is
+    only replaced once all the sites are saved."""
+    with atomic_open(filename, 'w') as outfile:
+        if filename.endswith('.jsonl'):
+            for site in sites:
+                outfile.write(json.dumps(site) + '\n')
+                yield site
+            return
+        # Same output as json.dump(list(sites), outfile, indent=4)
+        separator = '[\n'
+        for site in sites:
+            outfile.write(separator + indent(json.dumps(site, indent=4), '    '))
+            separator = ',\n'
+            yield site
+        outfile.write('[]' if separator == '[\n' else '\n]')
+
+def read_journal(journal):
+    """Return the sites recorded in the crawl journal at `journal`. A record that was
+    only partly written when the crawl was interrupted is skipped."""
+    sites = []
+    with open(journal) as infile:
+        for line in infile:
+            try:
+                sites.append(json.loads(line))
+            except ValueError:
+                logging.info(f'Skipping incomplete record "{line.strip()}" of journal {journal}')
+    return sites
+
+def open_journal(journal, resume=False):
+    """Open the crawl journal at `journal` to write the sites that are crawled to it,
+    one JSON record per line. The journal of a crawl that is resumed is appended to,
+    any other is replaced."""
+    outfile = open(journal, 'a' if resume else 'w')
+    if outfile.tell() > 0:
+        # Make sure a partly written record doesn't run into the next one.
+        with open(journal, 'rb') as infile:
+            infile.seek(-1, 2)
+            if infile.read(1) != b'\n':
+                outfile.write('\n')
+    return outfile
 
-def collect_icons_for_top_sites(topsitesfile, extrafile, count):
-    results = []
+def build_manifest(sites, minwidth):
+    """Return the manifest for `sites`, any iterable of raw site data: one entry per best
+    icon (at least `minwidth` wide, or an SVG) with the hostnames of all the sites that
+    use it, sorted alphabetically by their first hostname."""
+    # Entries are indexed by icon url so that grouping the sites takes linear time.
+    entries = {}
+    for site in sites:
+        hostname = site.get('hostname')
+        url = site.get('url')
+        icon = site.get('best_icon_url')
+        icon_width = site.get('best_icon_width')
+
+        # check if there is a best icon that satisfies the minwidth criteria
+        if not has_usable_icon(site, minwidth):
+            logging.info(f'No icon for "{url}" (best icon width: {icon_width})')
+            continue
+        existing = entries.get(icon)
+        if existing:
+            existing.get('domains').append(hostname)
+        else:
+            entries[icon] = {
+                'image_url': icon,
+                'domains': [hostname]
+            }
+
+    # Sort alphabetically
+    return sorted(entries.values(), key=lambda site: site['domains'][0])
+
+def is_excluded(hostname):
+    # Excluding a domain excludes its subdomains too, up to its registrable domain.
+    return not DOMAIN_EXCLUSIONS.isdisjoint(parent_domains(hostname))
+
+def filter_sites(sites):
+    """Drop the duplicate, NSFW and excluded hostnames from `sites`, a list of (rank,
+    hostname) pairs, before any of them is crawled. Returns the remaining sites, in
+    order, and the number of sites dropped for each reason."""
+    dropped = {'duplicate': 0, 'nsfw': 0, 'excluded': 0}
+    unique_sites = []
+    # Hostnames are compared the way domains are matched (see parent_domains), so the
+    # first spelling of a hostname is kept.
+    hostnames = set()
+    for rank, hostname in sites:
+        key = hostname.lower().rstrip('.')
+        if key in hostnames:
+            dropped['duplicate'] += 1
+            continue
+        hostnames.add(key)
+        unique_sites.append((rank, hostname))
+
+    nsfw = nsfw_domains(hostname for rank, hostname in unique_sites)
+    filtered_sites = []
+    for rank, hostname in unique_sites:
+        if hostname in nsfw:
+            dropped['nsfw'] += 1
+        elif is_excluded(hostname):
+            dropped['excluded'] += 1
+        else:
+            filtered_sites.append((rank, hostname))
+    return filtered_sites, dropped
+
+def iter_icons_for_top_sites(topsitesfile, extrafile, count, concurrency=1, shard=None, cache_dir=None,
+                             previous_sites=None, max_age=None, journal=None, resumed_sites=None,
+                             topsites_max_age=timedelta(days=1), target_width=None, icon_concurrency=1,
+                             stagger=None, archive=None, minwidth=0):
+    """Generate the raw data of the top sites (and the extra sites) in order, crawling
+    them as the data is consumed. See make_manifest for the meaning of the arguments."""
     extra_domains = []
     if extrafile:
         # Add extra domains if extra file is provided by user
         extra_domains = extra_sites(extrafile)
 
-    for rank, hostname in top_sites(topsitesfile, count) + extra_domains:
-        # Skip NSFW and blacklisted sites
-        if is_nsfw(hostname) or hostname in DOMAIN_EXCLUSION_LIST:
-            continue
+    # All the sites share one pool of keep-alive connections, with enough connections
+    # per host for every crawler (and icon downloading) thread. Responses are revalidated
+    # against the ones cached by previous runs, if any.
+    cache = HTTPCache(cache_dir) if cache_dir else None
+    session = CrawlSession(pool_maxsize=max(concurrency * icon_concurrency, DEFAULT_POOL_MAXSIZE), cache=cache,
+                           archive=archive)
+
+    topsites_cache_dir = os.path.join(cache_dir, 'top-sites') if cache_dir else None
+    try:
+        sites = top_sites(topsitesfile, count, topsites_cache_dir, topsites_max_age, session) + extra_domains
+    except BaseException:
+        session.close()
+        raise
+
+    # Skip duplicate, NSFW and blacklisted sites
+    sites, dropped = filter_sites(sites)
+    logging.info(f'Skipping {dropped["duplicate"]} duplicate, {dropped["nsfw"]} NSFW and '
+                 f'{dropped["excluded"]} excluded sites, {len(sites)} sites left')
 
-        url = 'https://{hostname}'.format(hostname=hostname)
-        icons = fetch_icons(url)
-        if len(icons) == 0 and 'www.' not in hostname:
-            # Retry with www. in the hostname as some domains require it explicitly.
-            url = f"https://www.{hostname}"
-            icons = fetch_icons(url)
-
-        best_icon_url, best_icon_width = get_best_icon(icons)
-        results.append({
-            'hostname': hostname,
-            'url': url,
-            'icons': icons,
-            'rank': rank,
-            'best_icon_url': best_icon_url,
-            'best_icon_width': best_icon_width
-        })
+    positions = None
+    if shard:
+        # Only crawl the sites of this shard. Each site keeps its position in the full
+        # list so that the shards can be merged back in order (see merge_shards).
+        index, total = shard
+        positions = [position for position, (rank, hostname) in enumerate(sites)
+                     if shard_of(hostname, total) == index - 1]
+        sites = [sites[position] for position in positions]
+        logging.info(f'Crawling {len(sites)} sites in shard {index}/{total}')
+
+    # Carry forward the sites of the previous crawl that are still good (see
+    # reusable_sites) and only crawl the others.
+    reusable = reusable_sites(previous_sites, max_age, minwidth) if previous_sites else {}
+    if resumed_sites:
+        # Sites in the journal of an interrupted crawl have been crawled by that very crawl.
+        reusable.update((site['hostname'], site) for site in resumed_sites)
+        logging.info(f'Resuming a crawl that already crawled {len(resumed_sites)} sites')
+    sites_to_crawl = [(rank, hostname) for rank, hostname in sites if hostname not in reusable]
+    if previous_sites or resumed_sites:
+        logging.info(f'Reusing {len(sites) - len(sites_to_crawl)} sites of the previous crawl, '
+                     f'crawling {len(sites_to_crawl)} sites')
+
+    journal_file = open_journal(journal, resume=resumed_sites is not None) if journal else None
+    # Sites that redirect to the same document as a site crawled before reuse its icons.
+    pages = CrawledPages()
+    # Icons shared by several sites are only sized once, even across runs if there is
+    # a cache directory.
+    icon_widths = IconWidths(path=os.path.join(cache_dir, 'icon-widths.json') if cache_dir else None)
+    crawled = iter_crawl_results(sites_to_crawl, concurrency, session, target_width, icon_concurrency,
+                                 stagger, pages, icon_widths)
+    downloads_avoided = 0
+    try:
+        for position, (rank, hostname) in zip(positions or range(len(sites)), sites):
+            if hostname in reusable:
+                result = dict(reusable[hostname], rank=rank)
+            else:
+                result = next(crawled)
+                downloads_avoided += result['downloads_avoided']
+                if journal_file:
+                    # Record every site as soon as it has been crawled so that an interrupted
+                    # crawl can be resumed from the journal.
+                    journal_file.write(json.dumps(result) + '\n')
+                    journal_file.flush()
+            if positions is not None:
+                result['position'] = position
+            yield result
+        stats = session.connection_stats()
+    finally:
+        crawled.close()
+        session.close()
+        if icon_widths.path:
+            icon_widths.save()
+        if journal_file:
+            journal_file.close()
     logging.info('Done fetching icons')
-    return results
+    logging.info(f'HTTP connections: {stats["requests"]} requests over {stats["connections"]} connections '
+                 f'({stats["reused"]} reused)')
+    logging.info(f'Icons sized from their declared metadata: {downloads_avoided} downloads avoided')
+    logging.info(f'Sites that redirect to a document crawled for another site: {pages.reused}')
+    logging.info(f'Icon widths: {icon_widths.hits} already known, {icon_widths.misses} unknown')
+    logging.info(f'Identical concurrent HTTP requests coalesced: {session.flights.shared}')
+    if archive is not None and not archive.record:
+        logging.info(f'HTTP archive: {archive.misses} requests not in the archive')
+    if cache is not None:
+        logging.info(f'HTTP cache: {cache.hits} responses not modified, {cache.misses} fetched')
 
+def collect_icons_for_top_sites(*args, **kwargs):
+    return list(iter_icons_for_top_sites(*args, **kwargs))
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option('--count', default=10, help='Number of sites from a list of Top Sites that should be used to generate the manifest. Default is 10.')
 @click.option('--topsitesfile', type=click.Path(exists=True), help='A csv file containing comma separated rank and domain information (in the same order) of the Top Sites. If no file is provided then Alexa Top Sites are used.')
 @click.option('--extrafile', type=click.Path(exists=True), help='A csv file containing domain information of extra top sites. If no file is provided then no extra Top Sites.')
 @click.option('--minwidth', default=96, help='Minimum width of the site icon. Only those sites that satisfy this requirement are added to the manifest. Default is 96.')
 @click.option('--loadrawsitedata', help='Load the full data from the filename specified')
-@click.option('--saverawsitedata', help='Save the full data to the filename specified')
-def make_manifest(count, minwidth, topsitesfile, extrafile, saverawsitedata, loadrawsitedata):
-    results = []
+@click.option('--saverawsitedata', help='Save the full data to the filename specified, one site per line if the filename ends with .jsonl')
+@click.option('--concurrency', default=1, type=click.IntRange(1, None), help='Number of sites that are crawled concurrently. Default is 1.')
+@click.option('--shard', metavar='INDEX/TOTAL', callback=parse_shard, help='Only crawl the sites of shard INDEX (starting at 1) out of TOTAL shards and save their raw data to the --saverawsitedata file instead of generating the manifest. Use the merge command to combine the raw data of all the shards.')
+@click.option('--cache-dir', type=click.Path(file_okay=False), help='A directory where HTTP responses, the widths of icons and the Alexa Top Sites list are cached. Cached responses are revalidated with conditional requests on later runs. If no directory is provided then nothing is cached.')
+@click.option('--incremental', type=click.Path(exists=True), help='Load the full data of a previous crawl from the filename specified and only crawl the sites that are new, had no icon at least --minwidth wide or were crawled more than --max-age days ago.')
+@click.option('--max-age', default=30, help='Age in days after which the sites of the previous crawl are crawled again with --incremental. Default is 30.')
+@click.option('--journal', help='Write the full data of each site to the filename specified (replacing it) as soon as it has been crawled, so that the crawl can be resumed with --resume if it is interrupted.')
+@click.option('--resume', type=click.Path(exists=True), help='Resume an interrupted crawl from the journal specified: the sites in the journal are not crawled again and the sites that are crawled are appended to it.')
+@click.option('--topsites-max-age', default=1, help='Age in days after which the Alexa Top Sites list cached in --cache-dir is refreshed. Default is 1.')
+@click.option('--target-width', type=click.IntRange(1, None), help='Stop downloading the icons of a site once one of them is known to be at least this wide, e.g. the --minwidth. The raw data then has an icon that is wide enough rather than the widest icon of each site. If no width is provided then the widest icon is looked for.')
+@click.option('--icon-concurrency', default=4, type=click.IntRange(1, None), help='Number of icons of a site that are downloaded concurrently. Default is 4.')
+@click.option('--speculative-stagger', type=float, metavar='SECONDS', help='Probe https://SITE, its favicon.ico, https://www.SITE and its favicon.ico speculatively, starting each of them SECONDS after the previous one rather than once it failed. The first of them that has an icon is still the one used. If no delay is provided then they are probed one after the other.')
+@click.option('--record', type=click.Path(dir_okay=False), metavar='ARCHIVE', help='Record the responses to all the HTTP requests of the crawl to the archive specified, so that the crawl can be replayed with --replay.')
+@click.option('--replay', type=click.Path(exists=True, dir_okay=False), metavar='ARCHIVE', help='Replay a crawl recorded with --record from the archive specified instead of sending HTTP requests. Requests that are not in the archive fail. Use the same options as the recorded crawl and no --cache-dir, or one in the same state.')
+@click.option('--replay-latency', is_flag=True, help='With --replay, make each response take as long as it did when it was recorded.')
+@click.pass_context
+def make_manifest(ctx, count, minwidth, topsitesfile, extrafile, saverawsitedata, loadrawsitedata, concurrency, shard, cache_dir,
+                  incremental, max_age, journal, resume, topsites_max_age, target_width,
+                  icon_concurrency, speculative_stagger, record, replay, replay_latency):
+    if ctx.invoked_subcommand is not None:
+        return
+    if shard and not saverawsitedata:
+        raise click.UsageError('--shard requires --saverawsitedata')
+    if incremental and loadrawsitedata:
+        raise click.UsageError('--incremental and --loadrawsitedata are mutually exclusive')
+    if journal and resume and journal != resume:
+        raise click.UsageError('--resume appends to the journal it resumes from, --journal must be the same file')
+    if speculative_stagger is not None and speculative_stagger < 0:
+        raise click.UsageError('--speculative-stagger must not be negative')
+    if record and replay:
+        raise click.UsageError('--record and --replay are mutually exclusive')
+    if replay_latency and not replay:
+        raise click.UsageError('--replay-latency requires --replay')
 
     if loadrawsitedata:
         logging.info(f'Loading raw icon data from {loadrawsitedata}')
-        with open(loadrawsitedata) as infile:
-            sites_with_icons = json.loads(infile.read())
+        sites_with_icons = load_raw_site_data(loadrawsitedata)
     else:
-        sites_with_icons = collect_icons_for_top_sites(topsitesfile, extrafile, count)
+        previous_sites = None
+        if incremental:
+            logging.info(f'Loading raw icon data of the previous crawl from {incremental}')
+            previous_sites = load_raw_site_data(incremental)
+        resumed_sites = None
+        if resume:
+            logging.info(f'Loading raw icon data of the interrupted crawl from {resume}')
+            resumed_sites = read_journal(resume)
+        archive = None
+        if record or replay:
+            archive = HTTPArchive(record or replay, record=bool(record), latency=replay_latency)
+            # The crawl ends when the manifest has been generated.
+            ctx.call_on_close(archive.close)
+        sites_with_icons = iter_icons_for_top_sites(topsitesfile, extrafile, count, concurrency, shard, cache_dir,
+                                                    previous_sites, timedelta(days=max_age),
+                                                    resume or journal, resumed_sites, timedelta(days=topsites_max_age),
+                                                    target_width, icon_concurrency, speculative_stagger, archive,
+                                                    minwidth)
         if saverawsitedata:
             logging.info(f'Saving raw icon data to {saverawsitedata}')
-            with open(saverawsitedata, 'w') as outfile:
-                json.dump(sites_with_icons, outfile, indent=4)
-
-    for site in sites_with_icons:
-        hostname = site.get('hostname')
-        url = site.get('url')
-        icon = site.get('best_icon_url')
-        icon_width = site.get('best_icon_width')
+            sites_with_icons = save_raw_site_data(sites_with_icons, saverawsitedata)
+        if shard:
+            for site in sites_with_icons:
+                pass
+            return
 
-        # check if there is a best icon that satisfies the minwidth criteria
-        if (icon is None) or ((icon_width != SVG_ICON_WIDTH) and (icon_width < minwidth)):
-            logging.info(f'No icon for "{url}" (best icon width: {icon_width})')
-            continue
-        existing = next((x for x in results if x.get('image_url') == icon), None)
-        if existing:
-            existing.get('domains').append(hostname)
-        else:
-            results.append({
-                'image_url': icon,
-                'domains': [hostname]
-            })
+    click.echo(json.dumps(build_manifest(sites_with_icons, minwidth), indent=4))
 
-    # Sort alphabetically
-    results = sorted(results, key=lambda site: site['domains'][0])
 
-    click.echo(json.dumps(results, indent=4))
+@make_manifest.command()
+@click.argument('shardfiles', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('--output', required=True, help='Save the merged data to the filename specified')
+def merge(shardfiles, output):
+    """Merge the raw site data saved by the shards of a crawl (see --shard)
+    into a single file that can be loaded with --loadrawsitedata."""
+    logging.info(f'Merging raw icon data of shards {", ".join(shardfiles)} into {output}')
+    shards = [load_raw_site_data(shardfile) for shardfile in shardfiles]
+    try:
+        for site in save_raw_site_data(merge_shards(shards), output):
+            pass
+    except ValueError as e:
+        raise click.ClickException(f'Cannot merge shards: {e}')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,104 @@
+import gzip
+import os
+import sys
+import threading
+
+
+# The rules of the Public Suffix List (https://publicsuffix.org/list/), including its
+# private domains, without the comments and with internationalized rules in both
+# their Unicode and ASCII (punycode) forms. It can be compiled from the list with:
+#
+#   $ python public_suffix.py public_suffix_list.dat
+PUBLIC_SUFFIXES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'public_suffixes.gz')
+PUBLIC_SUFFIX_LIST_URL = 'https://publicsuffix.org/list/public_suffix_list.dat'
+
+_index = None
+_index_lock = threading.Lock()
+
+
+class SuffixIndex:
+    """The rules of the Public Suffix List, split by kind: `rules` are public
+    suffixes, `wildcards` are the suffixes all the subdomains of which are public
+    suffixes (rules like *.ck) and `exceptions` are the subdomains of wildcards
+    that are not public suffixes (rules like !www.ck)."""
+
+    def __init__(self, rules):
+        self.rules = set()
+        self.wildcards = set()
+        self.exceptions = set()
+        for rule in rules:
+            if rule.startswith('!'):
+                self.exceptions.add(rule[1:])
+            elif rule.startswith('*.'):
+                self.wildcards.add(rule[2:])
+            else:
+                self.rules.add(rule)
+
+    def public_suffix_length(self, labels):
+        """Return the number of labels of the public suffix of the domain made of `labels`."""
+        length = 1
+        for n in range(1, len(labels) + 1):
+            suffix = '.'.join(labels[-n:])
+            if suffix in self.exceptions:
+                return n - 1
+            if suffix in self.rules or (n > 1 and '.'.join(labels[-n + 1:]) in self.wildcards):
+                length = n
+        return length
+
+
+def suffix_index():
+    """Return the index of public suffixes, loading it on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                with gzip.open(PUBLIC_SUFFIXES_PATH, 'rt', encoding='UTF-8') as infile:
+                    _index = SuffixIndex(line.strip() for line in infile if not line.startswith('//'))
+    return _index
+
+
+def _labels(hostname):
+    return hostname.lower().rstrip('.').split('.')
+
+
+def registrable_domain(hostname):
+    """Return the registrable domain (eTLD+1) of `hostname`, e.g. example.co.uk for
+    www.example.co.uk, or None if `hostname` is itself a public suffix."""
+    labels = _labels(hostname)
+    length = suffix_index().public_suffix_length(labels)
+    if len(labels) <= length:
+        return None
+    return '.'.join(labels[-length - 1:])
+
+
+def parent_domains(hostname):
+    """Return `hostname` and its parent domains down to its registrable domain, e.g.
+    [a.b.example.co.uk, b.example.co.uk, example.co.uk] for a.b.example.co.uk. A
+    hostname that is a public suffix is its only parent domain."""
+    labels = _labels(hostname)
+    length = suffix_index().public_suffix_length(labels)
+    return ['.'.join(labels[i:]) for i in range(max(len(labels) - length, 1))]
+
+
+def compile_public_suffixes(rules, path=PUBLIC_SUFFIXES_PATH):
+    """Compile the `rules` of the Public Suffix List (the lines of the list) to `path`."""
+    compiled = set()
+    for line in rules:
+        rule = line.split()[0] if line.strip() else ''
+        if not rule or rule.startswith('//'):
+            continue
+        compiled.add(rule)
+        prefix = rule[:1] if rule.startswith('!') else rule[:2] if rule.startswith('*.') else ''
+        try:
+            compiled.add(prefix + rule[len(prefix):].encode('idna').decode('ascii'))
+        except UnicodeError:
+            pass
+    with gzip.GzipFile(path, 'wb', mtime=0) as outfile:
+        outfile.write(f'// Compiled from {PUBLIC_SUFFIX_LIST_URL}, subject to the terms of the Mozilla '
+                      'Public License, v. 2.0.\n'.encode('UTF-8'))
+        outfile.write(''.join(f'{rule}\n' for rule in sorted(compiled)).encode('UTF-8'))
+
+
+if __name__ == '__main__':
+    with open(sys.argv[1], encoding='UTF-8') as infile:
+        compile_public_suffixes(infile)
@@ -0,0 +1,112 @@
+import struct
+import unittest
+from io import BytesIO
+
+from PIL import Image
+
+from image_size import get_image_size, UnsupportedImage
+
+
+def pillow_image(image_format, width, height, **kwargs):
+    data = BytesIO()
+    Image.new('RGB', (width, height)).save(data, image_format, **kwargs)
+    return data.getvalue()
+
+
+def png_chunk(chunk_type, data):
+    return struct.pack('>I', len(data)) + chunk_type + data + b'\0\0\0\0'
+
+
+def riff_webp(chunk, payload):
+    return b'RIFF' + struct.pack('<I', 4 + 8 + len(payload)) + b'WEBP' + chunk + struct.pack('<I', len(payload)) + payload
+
+
+def ico(*sizes):
+    header = struct.pack('<HHH', 0, 1, len(sizes))
+    entries = b''.join(struct.pack('<BBBBHHII', width % 256, height % 256, 0, 0, 1, 32, 0, 0)
+                       for width, height in sizes)
+    return header + entries
+
+
+class GetImageSizeTest(unittest.TestCase):
+
+    def assertSize(self, data, expected):
+        self.assertEqual(get_image_size(data), expected)
+        # Any prefix of the file is either too short to tell or enough to tell.
+        for length in range(len(data)):
+            self.assertIn(get_image_size(data[:length]), (None, expected), f'prefix of {length} bytes')
+
+    def test_png(self):
+        self.assertSize(pillow_image('PNG', 48, 32), ('png', 48, 32))
+
+    def test_ios_optimized_png(self):
+        data = (b'\x89PNG\r\n\x1a\n' + png_chunk(b'CgBI', b'\x50\x00\x20\x06') +
+                png_chunk(b'IHDR', struct.pack('>IIBBBBB', 120, 120, 8, 6, 0, 0, 0)))
+        self.assertSize(data, ('png', 120, 120))
+
+    def test_jpeg(self):
+        self.assertSize(pillow_image('JPEG', 57, 31), ('jpeg', 57, 31))
+
+    def test_progressive_jpeg_with_exif(self):
+        data = pillow_image('JPEG', 64, 64, progressive=True, exif=b'Exif\0\0' + b'\0' * 100)
+        self.assertSize(data, ('jpeg', 64, 64))
+
+    def test_gif(self):
+        self.assertSize(pillow_image('GIF', 16, 24), ('gif', 16, 24))
+
+    def test_webp_lossy(self):
+        frame = b'\0\0\0' + b'\x9d\x01\x2a' + struct.pack('<HH', 180, 120 | 0x4000)
+        self.assertSize(riff_webp(b'VP8 ', frame), ('webp', 180, 120))
+
+    def test_webp_lossless(self):
+        bits = (180 - 1) | ((120 - 1) << 14)
+        self.assertSize(riff_webp(b'VP8L', b'\x2f' + struct.pack('<I', bits)), ('webp', 180, 120))
+
+    def test_webp_extended(self):
+        payload = b'\0' * 4 + (1000 - 1).to_bytes(3, 'little') + (500 - 1).to_bytes(3, 'little')
+        self.assertSize(riff_webp(b'VP8X', payload), ('webp', 1000, 500))
+
+    def test_ico_largest_image(self):
+        self.assertSize(ico((16, 16), (48, 48), (32, 32)), ('ico', 48, 48))
+
+    def test_ico_256(self):
+        # A width or height of 0 means 256 pixels
+        self.assertSize(ico((32, 32), (256, 256)), ('ico', 256, 256))
+
+    def test_ico_without_images(self):
+        with self.assertRaises(UnsupportedImage):
+            get_image_size(struct.pack('<HHH', 0, 1, 0) + b'\0' * 16)
+
+    def test_svg(self):
+        self.assertSize(b'<svg xmlns="http://www.w3.org/2000/svg" width="64px" height="32"></svg>',
+                        ('svg', 64, 32))
+
+    def test_svg_view_box(self):
+        self.assertSize(b'\xef\xbb\xbf<?xml version="1.0"?>\n<svg viewBox="0,0,512,256"></svg>',
+                        ('svg', 512, 256))
+
+    def test_svg_width_and_view_box(self):
+        self.assertSize(b'<svg width="100" viewBox="0 0 512 256"></svg>', ('svg', 100, 50))
+
+    def test_svg_relative_width(self):
+        self.assertSize(b'<svg width="100%" height="100%" viewBox="0 0 24 24"></svg>', ('svg', 24, 24))
+
+    def test_svg_without_dimensions(self):
+        with self.assertRaises(UnsupportedImage):
+            get_image_size(b'<svg xmlns="http://www.w3.org/2000/svg"></svg>')
+
+    def test_html(self):
+        with self.assertRaises(UnsupportedImage):
+            get_image_size(b'<!DOCTYPE html>\n<html><head><title>Not found</title></head></html>')
+
+    def test_unknown_format(self):
+        with self.assertRaises(UnsupportedImage):
+            get_image_size(pillow_image('BMP', 16, 16))
+
+    def test_too_short(self):
+        self.assertIsNone(get_image_size(b''))
+        self.assertIsNone(get_image_size(b'\x89PNG'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from public_suffix import SuffixIndex, parent_domains, registrable_domain
+
+
+class SuffixIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = SuffixIndex(['com', 'uk', 'co.uk', '*.ck', '!www.ck'])
+
+    def public_suffix(self, hostname):
+        labels = hostname.split('.')
+        return '.'.join(labels[-self.index.public_suffix_length(labels):])
+
+    def test_rules(self):
+        self.assertEqual(self.public_suffix('www.example.com'), 'com')
+        self.assertEqual(self.public_suffix('www.example.co.uk'), 'co.uk')
+
+    def test_unknown_top_level_domain(self):
+        self.assertEqual(self.public_suffix('www.example.test'), 'test')
+
+    def test_wildcard(self):
+        self.assertEqual(self.public_suffix('www.example.co.ck'), 'co.ck')
+
+    def test_exception(self):
+        self.assertEqual(self.public_suffix('www.ck'), 'ck')
+        self.assertEqual(self.public_suffix('a.www.ck'), 'ck')
+
+
+class ParentDomainsTest(unittest.TestCase):
+
+    def test_subdomains(self):
+        self.assertEqual(parent_domains('a.b.example.co.uk'),
+                         ['a.b.example.co.uk', 'b.example.co.uk', 'example.co.uk'])
+
+    def test_registrable_domain(self):
+        self.assertEqual(parent_domains('example.com'), ['example.com'])
+
+    def test_public_suffix(self):
+        self.assertEqual(parent_domains('co.uk'), ['co.uk'])
+
+    def test_wildcard(self):
+        self.assertEqual(parent_domains('foo.bar.ck'), ['foo.bar.ck'])
+        self.assertEqual(parent_domains('a.foo.bar.ck'), ['a.foo.bar.ck', 'foo.bar.ck'])
+        self.assertIsNone(registrable_domain('bar.ck'))
+
+    def test_wildcard_exception(self):
+        self.assertEqual(parent_domains('www.ck'), ['www.ck'])
+        self.assertEqual(parent_domains('a.www.ck'), ['a.www.ck', 'www.ck'])
+        self.assertEqual(registrable_domain('www.ck'), 'www.ck')
+
+    def test_trailing_dot(self):
+        self.assertEqual(parent_domains('www.example.com.'), ['www.example.com', 'example.com'])
+
+    def test_case(self):
+        self.assertEqual(parent_domains('WWW.Example.CO.UK'), ['www.example.co.uk', 'example.co.uk'])
+
+
+if __name__ == '__main__':
+    unittest.main()